@@ -136,9 +136,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                         max_results_per_page = response.get("maxResults", 50)
                         next_page_token = str(current_start + max_results_per_page)
 
-                # Limit results to requested amount
-                if len(all_issues) > limit:
-                    all_issues = all_issues[:limit]
+                # Limit results to requested amount (in place, without a copy)
+                del all_issues[limit:]
 
                 response_dict_for_model = {
                     "issues": all_issues,
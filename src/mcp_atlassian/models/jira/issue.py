@@ -48,6 +48,22 @@ EPIC_LINK_PATTERNS = [
 ]
 
 
+def normalize_requested_fields(requested_fields: Any) -> Any:
+    """
+    Split a comma-separated requested fields string into field names.
+
+    Args:
+        requested_fields: The requested fields as passed by the caller
+
+    Returns:
+        A list of stripped field names for a string other than "*all",
+        otherwise the value unchanged
+    """
+    if isinstance(requested_fields, str) and requested_fields != "*all":
+        return [field.strip() for field in requested_fields.split(",")]
+    return requested_fields
+
+
 class JiraIssue(ApiModel, TimestampMixin):
     """
     Model representing a Jira issue.
@@ -251,21 +267,36 @@ class JiraIssue(ApiModel, TimestampMixin):
         Returns:
             A JiraIssue instance
         """
+        return cls.model_validate(cls._fields_from_api_response(data, **kwargs))
+
+    @classmethod
+    def _fields_from_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Extract JiraIssue constructor arguments from a Jira API response.
+
+        Args:
+            data: The issue data from the Jira API
+            **kwargs: Additional arguments to pass to the constructor
+
+        Returns:
+            A dictionary of field values, empty if the data is unusable
+        """
         if not data:
-            return cls()
+            return {}
 
         # Handle non-dictionary data by returning a default instance
         if not isinstance(data, dict):
             logger.debug("Received non-dictionary data, returning default instance")
-            return cls()
+            return {}
 
         fields = data.get("fields", {})
         if not isinstance(fields, dict):
             fields = {}
 
         # Get required simple fields
-        issue_id = str(data.get("id", JIRA_DEFAULT_ID))
-        key = str(data.get("key", JIRA_DEFAULT_KEY))
+        identity = cls._identity_from_api_response(data)
         summary = str(fields.get("summary", EMPTY_STRING))
         description = fields.get("description")
 
@@ -409,9 +440,6 @@ class JiraIssue(ApiModel, TimestampMixin):
         if timetracking_data:
             timetracking = JiraTimetracking.from_api_response(timetracking_data)
 
-        # URL
-        url = data.get("self")  # API URL for the issue
-
         # Try to find epic fields (varies by Jira instance)
         epic_key = None
         epic_name = None
@@ -439,51 +467,45 @@ class JiraIssue(ApiModel, TimestampMixin):
                     value_obj_to_store["name"] = human_readable_name
                 custom_fields[orig_field_id] = value_obj_to_store
 
-        # Handle requested_fields parameter
-        requested_fields_param = kwargs.get("requested_fields")
-
-        # Convert string requested_fields to list (except "*all")
-        if isinstance(requested_fields_param, str) and requested_fields_param != "*all":
-            requested_fields_param = requested_fields_param.split(",")
-            # Strip whitespace from each field name
-            requested_fields_param = [field.strip() for field in requested_fields_param]
-
-        # Create the issue instance with all the extracted data
-        return cls(
-            id=issue_id,
-            key=key,
-            summary=summary,
-            description=description,
-            created=created,
-            updated=updated,
-            status=status,
-            issue_type=issue_type,
-            priority=priority,
-            assignee=assignee,
-            reporter=reporter,
-            project=project,
-            resolution=resolution,
-            duedate=duedate,
-            resolutiondate=resolutiondate,
-            parent=parent,
-            subtasks=subtasks,
-            security=security,
-            worklog=worklog,
-            labels=labels,
-            components=components,
-            comments=comments,
-            attachments=attachments,
-            timetracking=timetracking,
-            url=url,
-            epic_key=epic_key,
-            epic_name=epic_name,
-            fix_versions=fix_versions,
-            custom_fields=custom_fields,
-            requested_fields=requested_fields_param,
-            changelogs=changelogs,
-            issuelinks=cls._extract_issue_links(fields),
+        # Convert string requested_fields to a list (except "*all")
+        requested_fields_param = normalize_requested_fields(
+            kwargs.get("requested_fields")
         )
 
+        # Collect all the extracted data for the issue instance
+        return {
+            **identity,
+            "summary": summary,
+            "description": description,
+            "created": created,
+            "updated": updated,
+            "status": status,
+            "issue_type": issue_type,
+            "priority": priority,
+            "assignee": assignee,
+            "reporter": reporter,
+            "project": project,
+            "resolution": resolution,
+            "duedate": duedate,
+            "resolutiondate": resolutiondate,
+            "parent": parent,
+            "subtasks": subtasks,
+            "security": security,
+            "worklog": worklog,
+            "labels": labels,
+            "components": components,
+            "comments": comments,
+            "attachments": attachments,
+            "timetracking": timetracking,
+            "epic_key": epic_key,
+            "epic_name": epic_name,
+            "fix_versions": fix_versions,
+            "custom_fields": custom_fields,
+            "requested_fields": requested_fields_param,
+            "changelogs": changelogs,
+            "issuelinks": cls._extract_issue_links(fields),
+        }
+
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
         result: dict[str, Any] = {
@@ -781,6 +803,23 @@ class JiraIssue(ApiModel, TimestampMixin):
                 return str(field_value)
         return None
 
+    @staticmethod
+    def _identity_from_api_response(data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract the id, key and API URL of an issue.
+
+        Args:
+            data: The issue data from the Jira API
+
+        Returns:
+            A dictionary with the id, key and url constructor arguments
+        """
+        return {
+            "id": str(data.get("id", JIRA_DEFAULT_ID)),
+            "key": str(data.get("key", JIRA_DEFAULT_KEY)),
+            "url": data.get("self"),  # API URL for the issue
+        }
+
     @staticmethod
     def _extract_issue_links(fields: dict[str, Any]) -> list[JiraIssueLink]:
         """
@@ -7,13 +7,57 @@ This module provides Pydantic models for Jira search (JQL) results.
 import logging
 from typing import Any
 
-from pydantic import Field, model_validator
+from pydantic import Field, TypeAdapter, field_serializer
 
 from ..base import ApiModel
-from .issue import JiraIssue
+from .issue import JiraIssue, normalize_requested_fields
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so a whole page of issues is validated in one call
+_ISSUES_ADAPTER = TypeAdapter(list[JiraIssue])
+
+# Requested fields that need nothing beyond the top-level issue identifiers
+_KEY_ONLY_FIELDS = frozenset({"id", "key"})
+
+
+def _coerce_int(value: Any, default: int) -> int:
+    """
+    Convert a pagination value from the Jira API to an int.
+
+    Args:
+        value: The raw value (usually already an int)
+        default: The value to use when missing or not convertible
+
+    Returns:
+        The integer value or the default
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _is_key_only(requested_fields: Any) -> bool:
+    """
+    Check whether the requested fields only ask for issue identifiers.
+
+    Args:
+        requested_fields: The requested fields, already split into names
+
+    Returns:
+        True if only id and/or key are requested
+    """
+    return (
+        isinstance(requested_fields, list | tuple | set)
+        and bool(requested_fields)
+        and _KEY_ONLY_FIELDS.issuperset(requested_fields)
+    )
+
 
 class JiraSearchResult(ApiModel):
     """
@@ -33,8 +77,14 @@ class JiraSearchResult(ApiModel):
         Create a JiraSearchResult from a Jira API response.
         Supports both old and new API response formats.
 
+        Issues are parsed into field dictionaries and validated in a single
+        TypeAdapter call. The pagination values are already coerced to ints,
+        so the result itself is assembled without validation.
+
         Args:
-            data: The search result data from the Jira API
+            data: The search result data from the Jira API, as decoded by the
+                Atlassian client (plain JSON types with ``str`` keys; numeric
+                pagination values may also arrive as strings)
             **kwargs: Additional arguments to pass to the constructor
 
         Returns:
@@ -43,73 +93,85 @@ class JiraSearchResult(ApiModel):
         if not data:
             return cls()
 
-        if not isinstance(data, dict):
+        try:
+            issues_data = data.get("issues", [])
+        except AttributeError:
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
-        issues = []
-        issues_data = data.get("issues", [])
+        # Split a comma-separated field list once for the whole page instead
+        # of once per issue inside JiraIssue
+        requested_fields = normalize_requested_fields(kwargs.get("requested_fields"))
+
+        issues: list[JiraIssue] = []
         if isinstance(issues_data, list):
-            for issue_data in issues_data:
-                if issue_data:
-                    # New API: Check if issue_data is just a string (issue ID)
-                    if isinstance(issue_data, str):
-                        # Create minimal JiraIssue with just the key
-                        issues.append(JiraIssue(key=issue_data))
-                    else:
-                        # Old API or new API with fields: Full issue object
-                        requested_fields = kwargs.get("requested_fields")
-                        issues.append(
-                            JiraIssue.from_api_response(
-                                issue_data, requested_fields=requested_fields
-                            )
-                        )
+            # When only keys were requested there is nothing else to parse.
+            # Issues with an expanded changelog or a names map still need the
+            # full parser, since custom fields may be requested by name.
+            key_only = _is_key_only(requested_fields)
+
+            def parse_issue(issue_data: Any) -> dict[str, Any]:
+                if isinstance(issue_data, str):
+                    return {"key": issue_data}
+                if (
+                    key_only
+                    and isinstance(issue_data, dict)
+                    and "changelog" not in issue_data
+                    and "names" not in issue_data
+                ):
+                    return {
+                        **JiraIssue._identity_from_api_response(issue_data),
+                        "requested_fields": requested_fields,
+                    }
+                return JiraIssue._fields_from_api_response(
+                    issue_data, requested_fields=requested_fields
+                )
+
+            # Validate the parsed fields of every issue in a single
+            # pydantic-core call rather than one constructor per issue.
+            # New API may return bare issue keys; those become minimal issues.
+            issues = _ISSUES_ADAPTER.validate_python(
+                [parse_issue(issue_data) for issue_data in issues_data if issue_data]
+            )
 
         # Handle different response formats between old and new APIs
         raw_total = data.get("total")
         raw_start_at = data.get("startAt")
         raw_max_results = data.get("maxResults")
 
-        # New API may not include these fields, especially when empty
-        # For new API, we need to infer values from available data
-        if raw_total is None and "isLast" in data:
-            # New API format - infer total from issues count if isLast=True
-            total = len(issues) if data.get("isLast", False) else -1
+        # New API may not include these fields, especially when empty.
+        # Infer total from the issue count on the last page; otherwise a
+        # missing total (including isLast=False) falls back to -1.
+        if raw_total is None and data.get("isLast"):
+            total = len(issues)
         else:
-            try:
-                total = int(raw_total) if raw_total is not None else -1
-            except (ValueError, TypeError):
-                total = -1
+            total = _coerce_int(raw_total, -1)
 
-        try:
-            start_at = int(raw_start_at) if raw_start_at is not None else 0
-        except (ValueError, TypeError):
-            start_at = 0
-
-        try:
-            max_results = int(raw_max_results) if raw_max_results is not None else -1
-        except (ValueError, TypeError):
-            max_results = -1
+        start_at = _coerce_int(raw_start_at, 0)
+        max_results = _coerce_int(raw_max_results, -1)
 
-        return cls(
+        return cls.model_construct(
             total=total,
             start_at=start_at,
             max_results=max_results,
             issues=issues,
         )
 
-    @model_validator(mode="after")
-    def validate_search_result(self) -> "JiraSearchResult":
+    @field_serializer("issues", when_used="json")
+    def serialize_issues(self, issues: list[JiraIssue]) -> list[dict[str, Any]]:
         """
-        Validate the search result.
+        Serialize issues in their simplified form for JSON output.
 
-        This validator ensures that pagination values are sensible and
-        consistent with the number of issues returned.
+        Only JSON serialization is affected, so model_dump still returns the
+        full issue models and round-trips through model_validate.
+
+        Args:
+            issues: The issues to serialize
 
         Returns:
-            The validated JiraSearchResult instance
+            A list of simplified issue dictionaries
         """
-        return self
+        return [issue.to_simplified_dict() for issue in issues]
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
@@ -186,7 +186,9 @@ async def search(
         Field(
             description=(
                 "(Optional) Comma-separated fields to return in the results. "
-                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+                "Use '*all' for all fields, 'key' to return only issue "
+                "identifiers (id, key and url), "
+                "or specify individual fields like 'summary,status,assignee,priority'"
             ),
             default=",".join(DEFAULT_READ_JIRA_FIELDS),
         ),
@@ -246,8 +248,7 @@ async def search(
         expand=expand,
         projects_filter=projects_filter,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return search_result.model_dump_json(indent=2)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -312,8 +313,7 @@ async def get_project_issues(
     search_result = jira.get_project_issues(
         project_key=project_key, start=start_at, limit=limit
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return search_result.model_dump_json(indent=2)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -502,8 +502,7 @@ async def get_board_issues(
         limit=limit,
         expand=expand,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return search_result.model_dump_json(indent=2)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -587,8 +586,7 @@ async def get_sprint_issues(
     search_result = jira.get_sprint_issues(
         sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return search_result.model_dump_json(indent=2)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
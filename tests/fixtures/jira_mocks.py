@@ -531,57 +531,3 @@ MOCK_JIRA_ISSUE_RESPONSE_SIMPLIFIED = {
         },
     },
 }
-
-MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED = {
-    "startAt": 0,
-    "maxResults": 5,
-    "total": 34,
-    "issues": [
-        {
-            "id": "12345",
-            "key": "PROJ-123",
-            "fields": {
-                "parent": {
-                    "id": "12340",
-                    "key": "PROJ-120",
-                    "fields": {
-                        "summary": "Parent Epic Summary",
-                        "status": {
-                            "name": "In Progress",
-                        },
-                        "issuetype": {
-                            "name": "Epic",
-                            "subtask": False,
-                        },
-                    },
-                },
-                "summary": "Test Issue Summary",
-                "description": "This is a test issue description",
-                "created": "2024-01-01T10:00:00.000+0000",
-                "updated": "2024-01-02T15:30:00.000+0000",
-                "status": {
-                    "name": "In Progress",
-                },
-                "issuetype": {
-                    "name": "Task",
-                    "subtask": False,
-                },
-                "project": {
-                    "key": "PROJ",
-                    "name": "Test Project",
-                },
-                "comment": {
-                    "comments": [
-                        {
-                            "id": "10000",
-                            "author": {"displayName": "Comment User"},
-                            "body": "This is a test comment",
-                            "created": "2024-01-01T12:00:00.000+0000",
-                        }
-                    ],
-                    "total": 1,
-                },
-            },
-        }
-    ],
-}
@@ -1,56 +1,294 @@
 """Tests for the Jira Search mixin."""
 
-from unittest.mock import ANY, MagicMock
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import ANY, MagicMock, call
 
 import pytest
-import requests
+from atlassian import Jira
+from requests import HTTPError
 
-from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
 
+# Shared API responses, built once at import. The top level is read-only;
+# tests hand a shallow dict() copy to the mocked client, which expects a dict.
+_ISSUE_FIELDS = {
+    "summary": "Test issue",
+    "issuetype": {"name": "Bug"},
+    "status": {"name": "Open"},
+    "description": "Issue description",
+    "created": "2024-01-01T10:00:00.000+0000",
+    "updated": "2024-01-01T11:00:00.000+0000",
+    "priority": {"name": "High"},
+}
+
+# Pagination metadata shared by every single-issue response
+_ENVELOPE = MappingProxyType(
+    {
+        "total": 1,
+        "startAt": 0,
+        "maxResults": 50,
+        "isLast": True,  # Add for Cloud API compatibility
+    }
+)
+
+_MOCK_RESPONSE = MappingProxyType(
+    {
+        **_ENVELOPE,
+        "issues": [{"id": "10001", "key": "TEST-123", "fields": _ISSUE_FIELDS}],
+    }
+)
+
+_EMPTY_DESCRIPTION_RESPONSE = MappingProxyType(
+    {
+        **_ENVELOPE,
+        "issues": [
+            {
+                "id": "10001",
+                "key": "TEST-123",
+                "fields": {**_ISSUE_FIELDS, "description": None},
+            }
+        ],
+    }
+)
+
+_MISSING_FIELDS_RESPONSE = MappingProxyType(
+    {
+        **_ENVELOPE,
+        # Missing id, issuetype, status, etc.
+        "issues": [{"key": "TEST-123", "fields": {"summary": "Test issue"}}],
+    }
+)
+
+_CUSTOM_FIELD_RESPONSE = MappingProxyType(
+    {
+        **_ENVELOPE,
+        "issues": [
+            {
+                "id": "10001",
+                "key": "TEST-123",
+                "fields": {
+                    **_ISSUE_FIELDS,
+                    "summary": "Test issue with custom field",
+                    "assignee": {
+                        "displayName": "Test User",
+                        "emailAddress": "test@example.com",
+                        "active": True,
+                    },
+                    "customfield_10049": "Custom value",
+                },
+            }
+        ],
+    }
+)
+
+# Server/DC responses may omit the pagination metadata entirely
+_EMPTY_SERVER_RESPONSE = MappingProxyType({"issues": []})
+
+# (jql, projects_filter, expected JQL) cases for the JQL construction tests
+_PROJECTS_FILTER_JQL_CASES: tuple[tuple[str, str, str], ...] = (
+    ("text ~ 'test'", "TEST", "(text ~ 'test') AND project = \"TEST\""),
+    ("text ~ 'test'", "TEST, DEV", '(text ~ \'test\') AND project IN ("TEST", "DEV")'),
+    ("text ~ 'test'", "TEST,DEV", '(text ~ \'test\') AND project IN ("TEST", "DEV")'),
+    # Existing JQL has priority, so the filter is ignored
+    ("project = OTHER", "TEST", "project = OTHER"),
+)
+
+# Run with config.projects_filter = "CONF1,CONF2"; None falls back to the config
+_CONFIG_PROJECTS_FILTER_JQL_CASES: tuple[tuple[str, str | None, str], ...] = (
+    ("text ~ 'test'", None, '(text ~ \'test\') AND project IN ("CONF1", "CONF2")'),
+    ("text ~ 'test'", "OVERRIDE", "(text ~ 'test') AND project = \"OVERRIDE\""),
+    (
+        "text ~ 'test'",
+        "OVER1,OVER2",
+        '(text ~ \'test\') AND project IN ("OVER1", "OVER2")',
+    ),
+)
+
+_EMPTY_JQL_CASES: tuple[tuple[str | None, str, str], ...] = (
+    ("", "PROJ1", 'project = "PROJ1"'),
+    ("", "PROJ1,PROJ2", 'project IN ("PROJ1", "PROJ2")'),
+    (None, "PROJ1", 'project = "PROJ1"'),
+)
+
+# JQL starting with ORDER BY gets the project filter prepended without AND
+_ORDER_BY_CASES: tuple[tuple[str, str, str], ...] = (
+    ("ORDER BY created DESC", "PROJ1", 'project = "PROJ1" ORDER BY created DESC'),
+    (
+        "ORDER BY created DESC",
+        "PROJ1,PROJ2",
+        'project IN ("PROJ1", "PROJ2") ORDER BY created DESC',
+    ),
+    ("order by updated ASC", "PROJ1", 'project = "PROJ1" order by updated ASC'),
+    (
+        "  ORDER BY priority DESC  ",
+        "PROJ1",
+        'project = "PROJ1"   ORDER BY priority DESC  ',
+    ),
+)
+
+
+def _install_response(mixin: SearchMixin, response: dict | None) -> MagicMock:
+    """Set the response of the search endpoint used by the mixin's deployment type.
+
+    Cloud searches go through ``jira.post`` (the /search/jql endpoint) while
+    Server/DC searches use ``jira.jql``.
+
+    Args:
+        mixin: The SearchMixin under test
+        response: The response the mocked endpoint should return
+
+    Returns:
+        The endpoint mock
+    """
+    search_mock = _search_endpoint(mixin)
+    search_mock.return_value = response
+    return search_mock
+
+
+def _expected_jql_call(jql: str):
+    """Build the expected Server/DC ``jira.jql`` call for a JQL string."""
+    return call(jql=jql, fields=ANY, start=ANY, limit=ANY, expand=ANY)
+
+
+def _assert_cloud_jql(search_mock: MagicMock, expected_jql: str) -> None:
+    """Assert that the last Cloud /search/jql call sent the expected JQL."""
+    search_mock.assert_called_with("rest/api/3/search/jql", json=ANY)
+    # Check the JQL in the payload
+    assert search_mock.call_args.kwargs["json"]["jql"] == expected_jql
+
+
+def _assert_server_jql(search_mock: MagicMock, expected_jql: str) -> None:
+    """Assert that the last Server/DC jql call sent the expected JQL."""
+    assert search_mock.call_args == _expected_jql_call(expected_jql)
+
+
+# (is_cloud, endpoint getter, JQL assertion) for each deployment type
+_API_MODES = [
+    pytest.param(True, attrgetter("jira.post"), _assert_cloud_jql, id="cloud"),
+    pytest.param(False, attrgetter("jira.jql"), _assert_server_jql, id="server"),
+]
+
+
+def _search_endpoint(mixin: SearchMixin) -> MagicMock:
+    """Return the mocked search endpoint for the mixin's deployment type."""
+    return mixin.jira.post if mixin.config.is_cloud else mixin.jira.jql
+
+
+def _check_basic(result: JiraSearchResult) -> None:
+    """Check the result parsed from _MOCK_RESPONSE."""
+    assert len(result.issues) == 1
+    assert result.total == 1
+    assert result.start_at == 0
+    assert result.max_results == 50
+
+    issue = result.issues[0]
+    assert issue.key == "TEST-123"
+    assert issue.summary == "Test issue"
+    assert issue.description == "Issue description"
+    assert issue.status is not None
+    assert issue.status.name == "Open"
+    assert issue.issue_type is not None
+    assert issue.issue_type.name == "Bug"
+    assert issue.priority is not None
+    assert issue.priority.name == "High"
+
+
+def _check_empty_description(result: JiraSearchResult) -> None:
+    """Check that an issue without a description is still parsed."""
+    assert len(result.issues) == 1
+    assert result.issues[0].key == "TEST-123"
+    assert result.issues[0].description is None
+    assert result.issues[0].summary == "Test issue"
+
+
+def _check_missing_fields(result: JiraSearchResult) -> None:
+    """Check that missing issue fields default to None."""
+    assert len(result.issues) == 1
+    assert result.issues[0].key == "TEST-123"
+    assert result.issues[0].summary == "Test issue"
+    assert result.issues[0].status is None
+    assert result.issues[0].issue_type is None
+
+
+def _check_empty_results(result: JiraSearchResult) -> None:
+    """Check an empty result; Server/DC total defaults to -1 when not provided."""
+    assert len(result.issues) == 0
+    assert result.total == -1
+
+
+def _check_custom_fields(result: JiraSearchResult) -> None:
+    """Check that requested fields, including custom fields, are kept."""
+    assert len(result.issues) == 1
+
+    # Convert to simplified dict to check field filtering
+    simplified = result.issues[0].to_simplified_dict()
 
+    # These fields should be included (plus id and key which are always included)
+    assert "id" in simplified
+    assert "key" in simplified
+    assert "summary" in simplified
+    assert "assignee" in simplified
+    assert "customfield_10049" in simplified
+
+    assert simplified["customfield_10049"] == {"value": "Custom value"}
+    assert simplified["assignee"]["display_name"] == "Test User"
+
+
+@pytest.mark.xdist_group("jira_search")
 class TestSearchMixin:
     """Tests for the SearchMixin class."""
 
-    @pytest.fixture
-    def search_mixin(self, jira_fetcher: JiraFetcher) -> SearchMixin:
-        """Create a SearchMixin instance with mocked dependencies."""
-        mixin = jira_fetcher
+    @pytest.fixture(scope="module")
+    def search_mixin(self) -> SearchMixin:
+        """Create a SearchMixin instance shared by the tests in this module."""
+        mixin = JiraFetcher(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                auth_type="basic",
+                username="test_username",
+                api_token="test_token",
+            )
+        )
+        # Only real API methods can be read or set; their child mocks are
+        # created once and reused by every test in the module
+        mixin.jira = MagicMock(spec_set=Jira)
 
         # Mock methods that are typically provided by other mixins
-        mixin._clean_text = MagicMock(side_effect=lambda text: text if text else "")
+        mixin._clean_text = lambda text: text or ""
 
-        # Set config with is_cloud=False by default (Server/DC)
-        mixin.config = MagicMock()
-        mixin.config.is_cloud = False
-        mixin.config.projects_filter = None
-        mixin.config.url = "https://example.atlassian.net"
+        # Only the attributes SearchMixin reads; reset per test by _reset_search_mixin
+        mixin.config = SimpleNamespace(
+            is_cloud=False,
+            projects_filter=None,
+            url="https://example.atlassian.net",
+        )
 
         return mixin
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_issues_response(self) -> dict:
-        """Create a mock Jira issues response for testing."""
-        return {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": "Test description",
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-        }
+        """Create a mock Jira issues response shared by the tests in this module.
+
+        The frozen _MOCK_RESPONSE is copied once per module; the search
+        methods reject non-dict responses, so the view itself is not returned.
+        """
+        return dict(_MOCK_RESPONSE)
+
+    @pytest.fixture(autouse=True)
+    def _reset_search_mixin(self, search_mixin: SearchMixin, mock_issues_response):
+        """Restore the shared mixin to Server/DC defaults before each test."""
+        search_mixin.config.is_cloud = False
+        search_mixin.config.projects_filter = None
+        search_mixin.config.url = "https://example.atlassian.net"
+
+        search_mixin.jira.reset_mock(return_value=True, side_effect=True)
+        # Both search endpoints return the shared response unless a test
+        # installs its own
+        search_mixin.jira.post.return_value = mock_issues_response
+        search_mixin.jira.jql.return_value = mock_issues_response
 
     @pytest.mark.parametrize(
         "is_cloud, expected_method_name",
@@ -62,7 +300,6 @@ class TestSearchMixin:
     def test_search_issues_calls_correct_method(
         self,
         search_mixin: SearchMixin,
-        mock_issues_response,
         is_cloud,
         expected_method_name,
     ):
@@ -74,12 +311,6 @@ class TestSearchMixin:
             "https://test.example.com"  # Model creation needs this
         )
 
-        # Setup: Mock response based on is_cloud
-        if is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues_response)
-
         # Act
         jql_query = "project = TEST"
         result = search_mixin.search_issues(jql_query, limit=10, start=0)
@@ -98,485 +329,75 @@ class TestSearchMixin:
                 jql=jql_query, fields=ANY, start=0, limit=10, expand=None
             )
 
-    def test_search_issues_basic(self, search_mixin: SearchMixin):
-        """Test basic search functionality."""
-        # Setup mock response
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": "Issue description",
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                        "priority": {"name": "High"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
-
-        # Call the method
-        result = search_mixin.search_issues("project = TEST")
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_once_with(
-                "rest/api/3/search/jql", json=ANY
-            )
-        else:
-            search_mixin.jira.jql.assert_called_once_with(
-                jql="project = TEST",
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-
-        # Verify results
-        assert isinstance(result, JiraSearchResult)
-        assert len(result.issues) == 1
-        assert all(isinstance(issue, JiraIssue) for issue in result.issues)
-        assert result.total == 1
-        assert result.start_at == 0
-        assert result.max_results == 50
-
-        # Check the first issue
-        issue = result.issues[0]
-        assert issue.key == "TEST-123"
-        assert issue.summary == "Test issue"
-        assert issue.description == "Issue description"
-        assert issue.status is not None
-        assert issue.status.name == "Open"
-        assert issue.issue_type is not None
-        assert issue.issue_type.name == "Bug"
-        assert issue.priority is not None
-        assert issue.priority.name == "High"
-
-        # Remove backward compatibility checks
-        assert "Issue description" in issue.description
-        assert issue.key == "TEST-123"
-
-    def test_search_issues_with_empty_description(self, search_mixin: SearchMixin):
-        """Test search with issues that have no description."""
-        # Setup mock response
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": None,
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
-
-        # Call the method
-        result = search_mixin.search_issues("project = TEST")
-
-        # Verify results
-        assert len(result.issues) == 1
-        assert isinstance(result.issues[0], JiraIssue)
-        assert result.issues[0].key == "TEST-123"
-        assert result.issues[0].description is None
-        assert result.issues[0].summary == "Test issue"
-
-        # Update to use direct properties instead of backward compatibility
-        assert "Test issue" in result.issues[0].summary
-
-    def test_search_issues_with_missing_fields(self, search_mixin: SearchMixin):
-        """Test search with issues missing some fields."""
-        # Setup mock response
-        mock_issues = {
-            "issues": [
-                {
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        # Missing issuetype, status, etc.
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
+    @pytest.mark.parametrize("is_cloud, get_mock, do_assert", _API_MODES)
+    @pytest.mark.parametrize(
+        "response, search_kwargs, check_result",
+        [
+            (_MOCK_RESPONSE, {}, _check_basic),
+            (_EMPTY_DESCRIPTION_RESPONSE, {}, _check_empty_description),
+            (_MISSING_FIELDS_RESPONSE, {}, _check_missing_fields),
+            (_EMPTY_SERVER_RESPONSE, {}, _check_empty_results),
+            (
+                _CUSTOM_FIELD_RESPONSE,
+                {"fields": "summary,assignee,customfield_10049"},
+                _check_custom_fields,
+            ),
+        ],
+        ids=[
+            "basic",
+            "empty_description",
+            "missing_fields",
+            "empty_results",
+            "fields_parameter",
+        ],
+    )
+    def test_search_issues_variants(
+        self,
+        search_mixin: SearchMixin,
+        is_cloud,
+        get_mock,
+        do_assert,
+        response,
+        search_kwargs,
+        check_result,
+    ):
+        """Test that search results are parsed for different response payloads."""
+        search_mixin.config.is_cloud = is_cloud
+        _install_response(search_mixin, dict(response))
 
-        # Call the method
-        result = search_mixin.search_issues("project = TEST")
+        result = search_mixin.search_issues("project = TEST", **search_kwargs)
 
-        # Verify results
-        assert len(result.issues) == 1
-        assert isinstance(result.issues[0], JiraIssue)
-        assert result.issues[0].key == "TEST-123"
-        assert result.issues[0].summary == "Test issue"
-        assert result.issues[0].status is None
-        assert result.issues[0].issue_type is None
-
-    def test_search_issues_with_empty_results(self, search_mixin: SearchMixin):
-        """Test search with no results."""
-        # Setup mock response for empty results
-        empty_response = {
-            "issues": [],
-            "total": 0,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=empty_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value={"issues": []})
+        search_mock = get_mock(search_mixin)
+        search_mock.assert_called_once()
+        do_assert(search_mock, "project = TEST")
 
-        # Call the method
-        result = search_mixin.search_issues("project = NONEXISTENT")
+        # Verify the API call includes the fields parameter when given
+        if "fields" in search_kwargs:
+            sent = search_mock.call_args.kwargs
+            if is_cloud:
+                # Cloud sends the fields as a list in the JSON payload
+                assert sent["json"]["fields"] == search_kwargs["fields"].split(",")
+            else:
+                assert sent["fields"] == search_kwargs["fields"]
 
-        # Verify results
         assert isinstance(result, JiraSearchResult)
-        assert len(result.issues) == 0
-        # For Cloud, total should be 0; for Server/DC, it defaults to -1 when not provided
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            assert result.total == 0
-        else:
-            assert result.total == -1
+        assert all(isinstance(issue, JiraIssue) for issue in result.issues)
+        check_result(result)
 
     def test_search_issues_with_error(self, search_mixin: SearchMixin):
         """Test search with API error."""
         # Setup mock to raise exception based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(side_effect=Exception("API Error"))
-        else:
-            search_mixin.jira.jql = MagicMock(side_effect=Exception("API Error"))
+        _search_endpoint(search_mixin).side_effect = Exception("API Error")
 
         # Call the method and verify it raises the expected exception
         with pytest.raises(Exception, match="Error searching issues"):
             search_mixin.search_issues("project = TEST")
 
-    def test_search_issues_with_projects_filter(self, search_mixin: SearchMixin):
-        """Test search with projects filter."""
-        # Setup mock response
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
-        search_mixin.config.url = "https://example.atlassian.net"
-
-        # Test with single project filter
-        result = search_mixin.search_issues("text ~ 'test'", projects_filter="TEST")
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == "(text ~ 'test') AND project = \"TEST\""
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql="(text ~ 'test') AND project = \"TEST\"",
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-        assert len(result.issues) == 1
-        assert result.total == 1
-
-        # Reset mock for next call
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test with multiple project filter
-        result = search_mixin.search_issues("text ~ 'test'", projects_filter="TEST,DEV")
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == '(text ~ \'test\') AND project IN ("TEST", "DEV")'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='(text ~ \'test\') AND project IN ("TEST", "DEV")',
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-        assert len(result.issues) == 1
-        assert result.total == 1
-
-    def test_search_issues_with_config_projects_filter(self, search_mixin: SearchMixin):
-        """Test search with projects filter from config."""
-        # Setup mock response
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
-        search_mixin.config.url = "https://example.atlassian.net"
-        search_mixin.config.projects_filter = "TEST,DEV"
-
-        # Test with config filter
-        result = search_mixin.search_issues("text ~ 'test'")
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == '(text ~ \'test\') AND project IN ("TEST", "DEV")'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='(text ~ \'test\') AND project IN ("TEST", "DEV")',
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-        assert len(result.issues) == 1
-        assert result.total == 1
-
-        # Reset mock for next call
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test with override
-        result = search_mixin.search_issues("text ~ 'test'", projects_filter="OVERRIDE")
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == "(text ~ 'test') AND project = \"OVERRIDE\""
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql="(text ~ 'test') AND project = \"OVERRIDE\"",
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-        assert len(result.issues) == 1
-        assert result.total == 1
-
-        # Reset mock for next call
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test with override - multiple projects
-        result = search_mixin.search_issues(
-            "text ~ 'test'", projects_filter="OVER1,OVER2"
-        )
-
-        # Verify based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert (
-                payload["jql"] == '(text ~ \'test\') AND project IN ("OVER1", "OVER2")'
-            )
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='(text ~ \'test\') AND project IN ("OVER1", "OVER2")',
-                fields=ANY,
-                start=0,
-                limit=50,
-                expand=None,
-            )
-        assert len(result.issues) == 1
-        assert result.total == 1
-
-    def test_search_issues_with_fields_parameter(self, search_mixin: SearchMixin):
-        """Test search with specific fields parameter, including custom fields."""
-        # Setup mock response with a custom field
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue with custom field",
-                        "assignee": {
-                            "displayName": "Test User",
-                            "emailAddress": "test@example.com",
-                            "active": True,
-                        },
-                        "customfield_10049": "Custom value",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": "Issue description",
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                        "priority": {"name": "High"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-            "isLast": True,  # Add for Cloud API compatibility
-        }
-
-        # Mock based on is_cloud setting
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues)
-        search_mixin.config.url = "https://example.atlassian.net"
-
-        # Call the method with specific fields
-        result = search_mixin.search_issues(
-            "project = TEST", fields="summary,assignee,customfield_10049"
-        )
-
-        # Verify the API call includes the fields parameter
-        if hasattr(search_mixin.config, "is_cloud") and search_mixin.config.is_cloud:
-            search_mixin.jira.post.assert_called_once_with(
-                "rest/api/3/search/jql", json=ANY
-            )
-            # Check the fields in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["fields"] == ["summary", "assignee", "customfield_10049"]
-        else:
-            search_mixin.jira.jql.assert_called_once_with(
-                jql="project = TEST",
-                fields="summary,assignee,customfield_10049",
-                start=0,
-                limit=50,
-                expand=None,
-            )
-
-        # Verify results
-        assert isinstance(result, JiraSearchResult)
-        assert len(result.issues) == 1
-        issue = result.issues[0]
-
-        # Convert to simplified dict to check field filtering
-        simplified = issue.to_simplified_dict()
-
-        # These fields should be included (plus id and key which are always included)
-        assert "id" in simplified
-        assert "key" in simplified
-        assert "summary" in simplified
-        assert "assignee" in simplified
-        assert "customfield_10049" in simplified
-
-        assert simplified["customfield_10049"] == {"value": "Custom value"}
-        assert "assignee" in simplified
-        assert simplified["assignee"]["display_name"] == "Test User"
-
-    def test_get_board_issues(self, search_mixin: SearchMixin):
+    def test_get_board_issues(
+        self, search_mixin: SearchMixin, mock_issues_response: dict
+    ):
         """Test get_board_issues method."""
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": "Issue description",
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                        "priority": {"name": "High"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-        }
-        search_mixin.jira.get_issues_for_board.return_value = mock_issues
+        search_mixin.jira.get_issues_for_board.return_value = mock_issues_response
 
         # Call the method
         result = search_mixin.get_board_issues("1000", jql="", limit=20)
@@ -613,37 +434,19 @@ class TestSearchMixin:
         assert "API Error" in str(e.value)
 
     def test_get_board_issues_http_error(self, search_mixin: SearchMixin):
-        search_mixin.jira.get_issues_for_board.side_effect = requests.HTTPError(
-            response=MagicMock(content="API Error content")
+        search_mixin.jira.get_issues_for_board.side_effect = HTTPError(
+            response=SimpleNamespace(content="API Error content")
         )
 
         with pytest.raises(Exception) as e:
             search_mixin.get_board_issues("1000", jql="", limit=20)
         assert "API Error content" in str(e.value)
 
-    def test_get_sprint_issues(self, search_mixin: SearchMixin):
+    def test_get_sprint_issues(
+        self, search_mixin: SearchMixin, mock_issues_response: dict
+    ):
         """Test get_sprint_issues method."""
-        mock_issues = {
-            "issues": [
-                {
-                    "id": "10001",
-                    "key": "TEST-123",
-                    "fields": {
-                        "summary": "Test issue",
-                        "issuetype": {"name": "Bug"},
-                        "status": {"name": "Open"},
-                        "description": "Issue description",
-                        "created": "2024-01-01T10:00:00.000+0000",
-                        "updated": "2024-01-01T11:00:00.000+0000",
-                        "priority": {"name": "High"},
-                    },
-                }
-            ],
-            "total": 1,
-            "startAt": 0,
-            "maxResults": 50,
-        }
-        search_mixin.jira.get_sprint_issues.return_value = mock_issues
+        search_mixin.jira.get_sprint_issues.return_value = mock_issues_response
 
         # Call the method
         result = search_mixin.get_sprint_issues("10001")
@@ -676,17 +479,29 @@ class TestSearchMixin:
         assert "API Error" in str(e.value)
 
     def test_get_sprint_issues_http_error(self, search_mixin: SearchMixin):
-        search_mixin.jira.get_sprint_issues.side_effect = requests.HTTPError(
-            response=MagicMock(content="API Error content")
+        search_mixin.jira.get_sprint_issues.side_effect = HTTPError(
+            response=SimpleNamespace(content="API Error content")
         )
 
         with pytest.raises(Exception) as e:
             search_mixin.get_sprint_issues("10001")
         assert "API Error content" in str(e.value)
 
-    @pytest.mark.parametrize("is_cloud", [True, False])
+    @pytest.mark.parametrize("is_cloud, get_mock, do_assert", _API_MODES)
+    @pytest.mark.parametrize(
+        "jql, projects_filter, expected_jql",
+        _PROJECTS_FILTER_JQL_CASES,
+        ids=["single", "multiple", "multiple_no_space", "existing_project"],
+    )
     def test_search_issues_with_projects_filter_jql_construction(
-        self, search_mixin: SearchMixin, mock_issues_response, is_cloud
+        self,
+        search_mixin: SearchMixin,
+        is_cloud,
+        get_mock,
+        do_assert,
+        jql,
+        projects_filter,
+        expected_jql,
     ):
         """Test that JQL string is correctly constructed when projects_filter is provided."""
         # Setup
@@ -696,87 +511,27 @@ class TestSearchMixin:
         )
         search_mixin.config.url = "https://test.example.com"
 
-        # Add isLast for Cloud API compatibility
-        mock_issues_response["isLast"] = True
-
-        # Setup mock response for both API methods
-        if is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues_response)
-
-        # Act: Single project filter
-        search_mixin.search_issues("text ~ 'test'", projects_filter="TEST")
-
-        # Assert: JQL verification
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == "(text ~ 'test') AND project = \"TEST\""
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql="(text ~ 'test') AND project = \"TEST\"",
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock for next call
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Act: Multiple projects filter
-        search_mixin.search_issues("text ~ 'test'", projects_filter="TEST, DEV")
-
-        # Assert: JQL verification
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == '(text ~ \'test\') AND project IN ("TEST", "DEV")'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='(text ~ \'test\') AND project IN ("TEST", "DEV")',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
+        result = search_mixin.search_issues(jql, projects_filter=projects_filter)
 
-        # Reset mock for next call
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Act: Call with both JQL and filter (existing JQL has priority)
-        search_mixin.search_issues("project = OTHER", projects_filter="TEST")
-
-        # Assert: JQL verification (existing JQL has priority, so filter is ignored)
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == "project = OTHER"
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql="project = OTHER",
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
+        do_assert(get_mock(search_mixin), expected_jql)
+        assert len(result.issues) == 1
+        assert result.total == 1
 
-    @pytest.mark.parametrize("is_cloud", [True, False])
+    @pytest.mark.parametrize("is_cloud, get_mock, do_assert", _API_MODES)
+    @pytest.mark.parametrize(
+        "jql, projects_filter, expected_jql",
+        _CONFIG_PROJECTS_FILTER_JQL_CASES,
+        ids=["config", "override", "override_multiple"],
+    )
     def test_search_issues_with_config_projects_filter_jql_construction(
-        self, search_mixin: SearchMixin, mock_issues_response, is_cloud
+        self,
+        search_mixin: SearchMixin,
+        is_cloud,
+        get_mock,
+        do_assert,
+        jql,
+        projects_filter,
+        expected_jql,
     ):
         """Test that JQL string is correctly constructed when config.projects_filter is used."""
         # Setup
@@ -784,64 +539,27 @@ class TestSearchMixin:
         search_mixin.config.projects_filter = "CONF1,CONF2"  # Set config filter
         search_mixin.config.url = "https://test.example.com"
 
-        # Add isLast for Cloud API compatibility
-        mock_issues_response["isLast"] = True
+        result = search_mixin.search_issues(jql, projects_filter=projects_filter)
 
-        # Setup mock response for both API methods
-        if is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues_response)
-
-        # Act: Use config filter
-        search_mixin.search_issues("text ~ 'test'")
-
-        # Assert: JQL verification
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert (
-                payload["jql"] == '(text ~ \'test\') AND project IN ("CONF1", "CONF2")'
-            )
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='(text ~ \'test\') AND project IN ("CONF1", "CONF2")',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock for next call
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Act: Override config filter with parameter
-        search_mixin.search_issues("text ~ 'test'", projects_filter="OVERRIDE")
-
-        # Assert: JQL verification
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == "(text ~ 'test') AND project = \"OVERRIDE\""
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql="(text ~ 'test') AND project = \"OVERRIDE\"",
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
+        do_assert(get_mock(search_mixin), expected_jql)
+        assert len(result.issues) == 1
+        assert result.total == 1
 
-    @pytest.mark.parametrize("is_cloud", [True, False])
+    @pytest.mark.parametrize("is_cloud, get_mock, do_assert", _API_MODES)
+    @pytest.mark.parametrize(
+        "jql, projects_filter, expected_jql",
+        _EMPTY_JQL_CASES,
+        ids=["empty_single", "empty_multiple", "none_single"],
+    )
     def test_search_issues_with_empty_jql_and_projects_filter(
-        self, search_mixin: SearchMixin, mock_issues_response, is_cloud
+        self,
+        search_mixin: SearchMixin,
+        is_cloud,
+        get_mock,
+        do_assert,
+        jql,
+        projects_filter,
+        expected_jql,
     ):
         """Test that empty JQL correctly prepends project filter without AND."""
         # Setup
@@ -849,85 +567,26 @@ class TestSearchMixin:
         search_mixin.config.projects_filter = None
         search_mixin.config.url = "https://test.example.com"
 
-        # Add isLast for Cloud API compatibility
-        mock_issues_response["isLast"] = True
-
-        # Setup mock response for both API methods
-        if is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues_response)
-
-        # Test 1: Empty string JQL with single project
-        search_mixin.search_issues("", projects_filter="PROJ1")
-
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project = "PROJ1"'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project = "PROJ1"',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test 2: Empty string JQL with multiple projects
-        search_mixin.search_issues("", projects_filter="PROJ1,PROJ2")
-
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project IN ("PROJ1", "PROJ2")'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project IN ("PROJ1", "PROJ2")',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test 3: None JQL with projects filter
-        result = search_mixin.search_issues(None, projects_filter="PROJ1")
+        result = search_mixin.search_issues(jql, projects_filter=projects_filter)
 
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project = "PROJ1"'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project = "PROJ1"',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
+        do_assert(get_mock(search_mixin), expected_jql)
         assert isinstance(result, JiraSearchResult)
 
-    @pytest.mark.parametrize("is_cloud", [True, False])
+    @pytest.mark.parametrize("is_cloud, get_mock, do_assert", _API_MODES)
+    @pytest.mark.parametrize(
+        "jql, projects_filter, expected_jql",
+        _ORDER_BY_CASES,
+        ids=["single", "multiple", "lowercase", "extra_spaces"],
+    )
     def test_search_issues_with_order_by_and_projects_filter(
-        self, search_mixin: SearchMixin, mock_issues_response, is_cloud
+        self,
+        search_mixin: SearchMixin,
+        is_cloud,
+        get_mock,
+        do_assert,
+        jql,
+        projects_filter,
+        expected_jql,
     ):
         """Test that JQL starting with ORDER BY correctly prepends project filter."""
         # Setup
@@ -935,108 +594,6 @@ class TestSearchMixin:
         search_mixin.config.projects_filter = None
         search_mixin.config.url = "https://test.example.com"
 
-        # Add isLast for Cloud API compatibility
-        mock_issues_response["isLast"] = True
+        search_mixin.search_issues(jql, projects_filter=projects_filter)
 
-        # Setup mock response based on is_cloud
-        if is_cloud:
-            search_mixin.jira.post = MagicMock(return_value=mock_issues_response)
-        else:
-            search_mixin.jira.jql = MagicMock(return_value=mock_issues_response)
-
-        # Test 1: ORDER BY with single project
-        search_mixin.search_issues("ORDER BY created DESC", projects_filter="PROJ1")
-
-        # Verify the correct API was called
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project = "PROJ1" ORDER BY created DESC'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project = "PROJ1" ORDER BY created DESC',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test 2: ORDER BY with multiple projects
-        search_mixin.search_issues(
-            "ORDER BY created DESC", projects_filter="PROJ1,PROJ2"
-        )
-
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert (
-                payload["jql"] == 'project IN ("PROJ1", "PROJ2") ORDER BY created DESC'
-            )
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project IN ("PROJ1", "PROJ2") ORDER BY created DESC',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test 3: Case insensitive ORDER BY
-        search_mixin.search_issues("order by updated ASC", projects_filter="PROJ1")
-
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project = "PROJ1" order by updated ASC'
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project = "PROJ1" order by updated ASC',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
-
-        # Reset mock
-        if is_cloud:
-            search_mixin.jira.post.reset_mock()
-        else:
-            search_mixin.jira.jql.reset_mock()
-
-        # Test 4: ORDER BY with extra spaces
-        search_mixin.search_issues(
-            "  ORDER BY priority DESC  ", projects_filter="PROJ1"
-        )
-
-        if is_cloud:
-            search_mixin.jira.post.assert_called_with("rest/api/3/search/jql", json=ANY)
-            # Check the JQL in the payload
-            call_args = search_mixin.jira.post.call_args
-            payload = call_args[1]["json"]
-            assert payload["jql"] == 'project = "PROJ1"   ORDER BY priority DESC  '
-        else:
-            search_mixin.jira.jql.assert_called_with(
-                jql='project = "PROJ1"   ORDER BY priority DESC  ',
-                fields=ANY,
-                start=ANY,
-                limit=ANY,
-                expand=ANY,
-            )
+        do_assert(get_mock(search_mixin), expected_jql)
@@ -5,10 +5,13 @@ These tests validate the conversion of Jira API responses to structured models
 and the simplified dictionary conversion for API responses.
 """
 
+import json
 import os
 import re
+from unittest.mock import patch
 
 import pytest
+from pydantic_core import PydanticSerializationError
 
 from src.mcp_atlassian.models.constants import (
     EMPTY_STRING,
@@ -1083,6 +1086,28 @@ class TestJiraSearchResult:
         assert result.max_results == 0
         assert result.issues == []
 
+    def test_from_api_response_with_non_dict_data(self):
+        """Test that non-dictionary data yields an empty JiraSearchResult."""
+        result = JiraSearchResult.from_api_response(["PROJ-1"])
+        assert result == JiraSearchResult()
+
+    def test_from_api_response_with_mixed_issue_keys(self):
+        """Test that issue order is kept when keys and issues are mixed."""
+        api_data = {
+            "issues": [
+                "PROJ-1",
+                {"id": "10002", "key": "PROJ-2", "fields": {"summary": "Two"}},
+                "PROJ-3",
+            ],
+            "isLast": True,
+        }
+
+        result = JiraSearchResult.from_api_response(api_data)
+
+        assert [issue.key for issue in result.issues] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert result.issues[1].summary == "Two"
+        assert result.total == 3
+
     def test_from_api_response_missing_metadata(self, jira_search_data):
         """Test creating a JiraSearchResult when API is missing metadata."""
         # Remove total, startAt, maxResults from mock data
@@ -1098,6 +1123,30 @@ class TestJiraSearchResult:
         assert search_result.max_results == -1
         assert len(search_result.issues) == 1  # Assuming mock data has issues
 
+    @pytest.mark.parametrize("is_last, expected_total", [(True, 1), (False, -1)])
+    def test_from_api_response_infers_total_from_is_last(
+        self, jira_search_data, is_last, expected_total
+    ):
+        """Test that the new API total is inferred only on the last page."""
+        api_data = {"issues": jira_search_data["issues"], "isLast": is_last}
+
+        search_result = JiraSearchResult.from_api_response(api_data)
+        assert search_result.total == expected_total
+
+    def test_from_api_response_coerces_metadata(self, jira_search_data):
+        """Test that string metadata is converted and invalid values fall back."""
+        api_data = {
+            **jira_search_data,
+            "total": "34",
+            "startAt": "invalid",
+            "maxResults": None,
+        }
+
+        search_result = JiraSearchResult.from_api_response(api_data)
+        assert search_result.total == 34
+        assert search_result.start_at == 0
+        assert search_result.max_results == -1
+
     def test_to_simplified_dict(self, jira_search_data):
         """Test converting JiraSearchResult to a simplified dictionary."""
         search_result = JiraSearchResult.from_api_response(jira_search_data)
@@ -1135,6 +1184,102 @@ class TestJiraSearchResult:
         assert "created" in issue
         assert "updated" in issue
 
+    @pytest.mark.parametrize("requested_fields", [None, "summary,status", "*all"])
+    def test_model_dump_json_matches_simplified_dict(
+        self, jira_search_data, requested_fields
+    ):
+        """Test that model_dump_json matches the json.dumps output of the dict."""
+        api_data = dict(jira_search_data)
+        first_issue = dict(api_data["issues"][0])
+        first_issue["fields"] = {**first_issue["fields"], "summary": "Überprüfung ✓"}
+        api_data["issues"] = [first_issue, *api_data["issues"][1:]]
+        search_result = JiraSearchResult.from_api_response(
+            api_data, requested_fields=requested_fields
+        )
+
+        assert search_result.model_dump_json(indent=2) == json.dumps(
+            search_result.to_simplified_dict(), indent=2, ensure_ascii=False
+        )
+
+    def test_model_dump_round_trip(self, jira_search_data):
+        """Test that model_dump keeps full issues and validates back."""
+        search_result = JiraSearchResult.from_api_response(jira_search_data)
+        dumped = search_result.model_dump()
+
+        assert dumped["issues"][0]["id"] == search_result.issues[0].id
+        assert JiraSearchResult.model_validate(dumped) == search_result
+
+    def test_to_simplified_dict_propagates_issue_errors(self, jira_search_data):
+        """Test that issue simplification errors are not wrapped by pydantic."""
+        search_result = JiraSearchResult.from_api_response(jira_search_data)
+
+        with patch.object(JiraIssue, "to_simplified_dict", side_effect=KeyError("x")):
+            with pytest.raises(KeyError):
+                search_result.to_simplified_dict()
+
+    def test_model_dump_json_wraps_issue_errors(self, jira_search_data):
+        """Test that model_dump_json reports issue errors through pydantic."""
+        search_result = JiraSearchResult.from_api_response(jira_search_data)
+
+        with patch.object(JiraIssue, "to_simplified_dict", side_effect=KeyError("x")):
+            with pytest.raises(
+                PydanticSerializationError, match="serialize_issues.*KeyError"
+            ):
+                search_result.model_dump_json(indent=2)
+
+    def test_from_api_response_splits_requested_fields(self, jira_search_data):
+        """Test that comma-separated requested fields are passed as a list."""
+        search_result = JiraSearchResult.from_api_response(
+            jira_search_data, requested_fields="summary, status"
+        )
+        assert search_result.issues[0].requested_fields == ["summary", "status"]
+
+    @pytest.mark.parametrize(
+        "requested_fields", ["key", "key,id", ["key"], ("key",), {"key", "id"}]
+    )
+    def test_from_api_response_key_only_fields(
+        self, jira_search_data, requested_fields
+    ):
+        """Test that key-only requests skip field parsing but simplify the same."""
+        search_result = JiraSearchResult.from_api_response(
+            jira_search_data, requested_fields=requested_fields
+        )
+        issue = search_result.issues[0]
+        assert issue.key == "PROJ-123"
+        assert issue.summary == ""
+
+        full_issue = JiraIssue.from_api_response(
+            jira_search_data["issues"][0], requested_fields=requested_fields
+        )
+        assert issue.requested_fields == full_issue.requested_fields
+        assert issue.to_simplified_dict() == full_issue.to_simplified_dict()
+
+    @pytest.mark.parametrize("requested_fields", ["key", "key,id", ("key",)])
+    def test_from_api_response_key_only_fields_with_names(self, requested_fields):
+        """Test that custom fields named like key or id are kept for key requests."""
+        issue_data = {
+            "id": "10001",
+            "key": "PROJ-1",
+            "self": "https://example.atlassian.net/rest/api/2/issue/10001",
+            "fields": {
+                "summary": "Named custom fields",
+                "customfield_10010": "custom key",
+                "customfield_10011": "custom id",
+            },
+            "names": {"customfield_10010": "Key", "customfield_10011": "Id"},
+        }
+        search_result = JiraSearchResult.from_api_response(
+            {"issues": [issue_data], "isLast": True},
+            requested_fields=requested_fields,
+        )
+
+        full_issue = JiraIssue.from_api_response(
+            issue_data, requested_fields=requested_fields
+        )
+        issue = search_result.issues[0]
+        assert issue.custom_fields == full_issue.custom_fields
+        assert issue.to_simplified_dict() == full_issue.to_simplified_dict()
+
     def test_to_simplified_dict_empty_result(self):
         """Test converting an empty JiraSearchResult to a simplified dictionary."""
         search_result = JiraSearchResult()
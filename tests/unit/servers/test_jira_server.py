@@ -14,13 +14,14 @@ from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
 from tests.fixtures.jira_mocks import (
     MOCK_JIRA_COMMENTS_SIMPLIFIED,
     MOCK_JIRA_ISSUE_RESPONSE_SIMPLIFIED,
-    MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED,
+    MOCK_JIRA_JQL_RESPONSE,
 )
 
 logger = logging.getLogger(__name__)
@@ -78,23 +79,14 @@ def mock_jira_fetcher():
 
     # Configure search_issues to return fixture data
     def mock_search_issues(jql, **kwargs):
-        mock_search_result = MagicMock()
-        issues = []
-        for issue_data in MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED["issues"]:
-            mock_issue = MagicMock()
-            mock_issue.to_simplified_dict.return_value = issue_data
-            issues.append(mock_issue)
-        mock_search_result.issues = issues
-        mock_search_result.total = len(issues)
-        mock_search_result.start_at = kwargs.get("start", 0)
-        mock_search_result.max_results = kwargs.get("limit", 50)
-        mock_search_result.to_simplified_dict.return_value = {
-            "total": len(issues),
-            "start_at": kwargs.get("start", 0),
-            "max_results": kwargs.get("limit", 50),
-            "issues": [issue.to_simplified_dict() for issue in issues],
-        }
-        return mock_search_result
+        return JiraSearchResult.from_api_response(
+            {
+                **MOCK_JIRA_JQL_RESPONSE,
+                "startAt": kwargs.get("start", 0),
+                "maxResults": kwargs.get("limit", 50),
+            },
+            requested_fields=kwargs.get("fields"),
+        )
 
     mock_fetcher.search_issues.side_effect = mock_search_issues
 
@@ -463,6 +455,15 @@ async def test_search(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_search_issue_serialization_error(jira_client, mock_jira_fetcher):
+    """Test that an error while simplifying an issue fails the search tool."""
+    with patch.object(JiraIssue, "to_simplified_dict", side_effect=KeyError("summary")):
+        with pytest.raises(ToolError) as excinfo:
+            await jira_client.call_tool("jira_search", {"jql": "project = TEST"})
+    assert "Error calling tool 'search'" in str(excinfo.value)
+
+
 @pytest.mark.anyio
 async def test_create_issue(jira_client, mock_jira_fetcher):
     """Test the create_issue tool with fixture data."""